@@ -7,13 +7,14 @@ from .const import (
     CONF_SWITCH_CONFIGS,
     CONF_MANAGED_SWITCHES,
     CONF_STORE,
+    CONF_BLUEPRINT_CACHE,
     LOGGER    
 )
-from .store import SwitchManagerStore
-from .helpers import load_blueprints, VERSION, deploy_blueprints, check_blueprints_folder_exists, _get_blueprint, _get_switch_config, _set_switch_config
+from .store import SwitchManagerStore, SwitchManagerBlueprintCache
+from .helpers import find_blueprints, load_blueprints, VERSION, deploy_blueprints, check_blueprints_folder_exists, _get_blueprint, _get_switch_config, _set_switch_config
 from .view import async_setup_view, async_bind_blueprint_images
 from . import models
-from .schema import BLUEPRINT_MQTT_SCHEMA, BLUEPRINT_EVENT_SCHEMA, SERVICE_SET_VARIABLES_SCHEMA
+from .schema import validate_blueprint, SERVICE_SET_VARIABLES_SCHEMA
 from .connections import async_setup_connections
 from homeassistant.core import Config, HomeAssistant, callback
 from homeassistant.config import _format_config_error
@@ -28,7 +29,8 @@ async def async_setup( hass: HomeAssistant, config: Config ):
         CONF_BLUEPRINTS: {},
         CONF_SWITCH_CONFIGS: {},
         CONF_MANAGED_SWITCHES: {},
-        CONF_STORE: SwitchManagerStore(hass)
+        CONF_STORE: SwitchManagerStore(hass),
+        CONF_BLUEPRINT_CACHE: SwitchManagerBlueprintCache(hass)
     }
     # Init hass storage
     await hass.data[DOMAIN][CONF_STORE].load()
@@ -43,8 +45,9 @@ async def async_setup( hass: HomeAssistant, config: Config ):
     async def reload_all( call ):
         for switch_id in hass.data[DOMAIN][CONF_MANAGED_SWITCHES]:
             hass.data[DOMAIN][CONF_MANAGED_SWITCHES][switch_id].stop()
-        hass.data[DOMAIN][CONF_BLUEPRINTS] = {}
-        hass.data[DOMAIN][CONF_MANAGED_SWITCHES] = {}
+        # Clear in place as the websocket handlers hold references to these
+        hass.data[DOMAIN][CONF_BLUEPRINTS].clear()
+        hass.data[DOMAIN][CONF_MANAGED_SWITCHES].clear()
 
         await hass.data[DOMAIN][CONF_STORE].load()
         await _init_blueprints(hass)
@@ -85,19 +88,46 @@ async def async_migrate( hass, in_dev ):
 
 async def _init_blueprints( hass: HomeAssistant ):
     # Ensure blueprints empty for clean state
-    blueprints = hass.data[DOMAIN][CONF_BLUEPRINTS] = {}
-    for config in load_blueprints(hass):
+    blueprints = hass.data[DOMAIN][CONF_BLUEPRINTS]
+    blueprints.clear()
+    cache = hass.data[DOMAIN][CONF_BLUEPRINT_CACHE]
+    files = await find_blueprints(hass)
+
+    # Reuse the validated data while the version and blueprint files are unchanged
+    validated = await cache.load(VERSION, files)
+    if validated is None:
+        configs = await load_blueprints(hass, files)
+        # Validation is pure CPU work so keep it off the event loop
+        validated = [
+            {**config, 'data': c_validated}
+            for config, c_validated in await hass.async_add_executor_job(_validate_blueprints, configs)
+        ]
+        # Only cache a complete set so invalid blueprints are still reported on the next start
+        if len(validated) == len(files):
+            await cache.save(VERSION, files, validated)
+
+    for config in validated:
+        blueprints[config['id']] = models.Blueprint(hass, config['id'], config['data'], config['has_image'])
+
+def _validate_blueprints( configs: list ) -> list:
+    """Validate loaded blueprint configs in a single pass, returning (config, validated) pairs."""
+    validated = []
+    for config in configs:
         try:
-            c_validated = BLUEPRINT_MQTT_SCHEMA(config.get('data')) if config.get('data').get('event_type') == 'mqtt' else BLUEPRINT_EVENT_SCHEMA(config.get('data'))
+            c_validated = validate_blueprint(config['data'])
         except vol.Invalid as ex:
-            LOGGER.error(_format_config_error(ex, f"{DOMAIN} {CONF_BLUEPRINTS}({config.get('id')})", config))
+            _log_invalid_blueprint( ex, config )
             continue
         if len(c_validated.get('buttons')) == 1:
             button = c_validated.get('buttons')[0]
             if button.get('x') or button.get('y') or button.get('width') or button.get('height') or button.get('d'):
                 LOGGER.error(f"{DOMAIN} {CONF_BLUEPRINTS}({config.get('id')}) Single button blueprints should not have x, y, width, height or d")
                 continue
-        blueprints[config.get('id')] = models.Blueprint(hass, config.get('id'), c_validated, config.get('has_image'))
+        validated.append( (config, c_validated) )
+    return validated
+
+def _log_invalid_blueprint( ex: vol.Invalid, config: dict ):
+    LOGGER.error(_format_config_error(ex, f"{DOMAIN} {CONF_BLUEPRINTS}({config.get('id')})", config))
 
 
 async def _init_switch_configs( hass: HomeAssistant ):
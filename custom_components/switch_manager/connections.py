@@ -2,20 +2,28 @@ from __future__ import annotations
 
 from typing import Any
 import voluptuous as vol
+from voluptuous.humanize import humanize_error
 from homeassistant.helpers import config_validation as cv
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import event_message
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers import issue_registry as ir
 
 from .schema import SWITCH_MANAGER_CONFIG_SCHEMA
-from .helpers import _get_blueprint, _get_switch_config, _remove_switch_config, _set_switch_config
+from .helpers import _remove_switch_config, _set_switch_config
 from .const import DOMAIN, CONF_BLUEPRINTS, CONF_MANAGED_SWITCHES, CONF_STORE
-from .models import ManagedSwitchConfig
+from .models import Blueprint, ManagedSwitchConfig
 
 async def async_setup_connections( hass ):
-  
+    # Bind once; these are only ever mutated in place (see reload_all).
+    # Lookups below mirror helpers._get_blueprint/_get_switch_config
+    domain_data = hass.data[DOMAIN]
+    store = domain_data[CONF_STORE]
+    blueprints = domain_data[CONF_BLUEPRINTS]
+    managed_switches = domain_data[CONF_MANAGED_SWITCHES]
+
     @websocket_api.websocket_command({
         vol.Required("type"): "switch_manager/blueprints", 
         vol.Optional("blueprint_id"): cv.string
@@ -26,10 +34,17 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        data = { "blueprint": _get_blueprint(hass, msg['blueprint_id'] ) } if msg.get('blueprint_id') \
-            else { "blueprints": hass.data[DOMAIN].get(CONF_BLUEPRINTS) }
+        # Send pre-serialized blueprints rather than re-encoding the object graph
+        if msg.get('blueprint_id'):
+            blueprint = blueprints.get(msg['blueprint_id'], msg['blueprint_id'])
+            payload = '{"blueprint":%s}' % (blueprint.as_json() if isinstance(blueprint, Blueprint) else json_dumps(blueprint))
+        else:
+            payload = '{"blueprints":{%s}}' % ','.join(
+                    f"{json_dumps(_id)}:{blueprint.as_json()}" for _id, blueprint in blueprints.items()
+                )
 
-        connection.send_result( msg["id"], data )
+        # Result frame built inline; construct_result_message is not available in 2022.11
+        connection.send_message( f'{{"id":{msg["id"]},"type":"result","success":true,"result":{payload}}}' )
 
     @websocket_api.websocket_command({
         vol.Required("type"): "switch_manager/blueprints/auto_discovery", 
@@ -41,7 +56,7 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        blueprint = _get_blueprint(hass, msg['blueprint_id'])
+        blueprint = blueprints.get(msg['blueprint_id'], msg['blueprint_id'])
         @callback
         def send( data ):
             connection.send_message(event_message(msg["id"], data))
@@ -67,10 +82,10 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        data = { "config":_get_switch_config(hass, msg['config_id'] ) } if msg.get('config_id') \
-            else { "configs": hass.data[DOMAIN].get(CONF_MANAGED_SWITCHES) }
-
-        connection.send_result( msg["id"], data )
+        if msg.get('config_id'):
+            connection.send_result( msg["id"], { "config": managed_switches.get(msg['config_id']) } )
+            return
+        connection.send_result( msg["id"], { "configs": managed_switches } )
 
     @websocket_api.websocket_command({
         vol.Required("type"): "switch_manager/config/monitor", 
@@ -82,7 +97,7 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        config = _get_switch_config( hass, msg['config_id'] )
+        config = managed_switches.get(msg['config_id'])
 
         @callback
         def send( data ):
@@ -99,7 +114,7 @@ async def async_setup_connections( hass ):
 
     @websocket_api.websocket_command({
         vol.Required("type"): "switch_manager/config/save", 
-        vol.Required('config'): SWITCH_MANAGER_CONFIG_SCHEMA,
+        vol.Required('config'): dict,
         vol.Optional('fix_mismatch', default=False): bool
     })
     @websocket_api.async_response
@@ -109,21 +124,27 @@ async def async_setup_connections( hass ):
         msg: dict[str, Any],
     ) -> None:
         config: ManagedSwitchConfig
-        store = hass.data[DOMAIN][CONF_STORE]
 
-        if msg['config'].get('id'):
-            config = _get_switch_config( hass, msg['config'].get('id') )
+        # Validate in the executor so large configs don't hold up the event loop
+        try:
+            msg_config = await hass.async_add_executor_job( SWITCH_MANAGER_CONFIG_SCHEMA, msg['config'] )
+        except vol.Invalid as ex:
+            connection.send_error( msg['id'], websocket_api.ERR_INVALID_FORMAT, humanize_error(msg['config'], ex) )
+            return
+
+        if msg_config.get('id'):
+            config = managed_switches.get(msg_config.get('id'))
             if msg['fix_mismatch']:
-                config.setBlueprint( config.blueprint, msg['config'].get('buttons') )
+                config.setBlueprint( config.blueprint, msg_config.get('buttons') )
                 ir.async_delete_issue(hass, DOMAIN, f"switch_{config.id}_mismatch")
-            config.update( msg['config'] )
+            config.update( msg_config )
             await config.start()
         else:
             config = ManagedSwitchConfig( 
                 hass, 
-                _get_blueprint( hass, msg['config']['blueprint'] ), 
+                blueprints.get(msg_config['blueprint'], msg_config['blueprint']), 
                 store.get_available_id(), 
-                msg['config'] 
+                msg_config 
             )
             await _set_switch_config( hass, config )
 
@@ -145,13 +166,11 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        store = hass.data[DOMAIN][CONF_STORE]
-
-        config = _get_switch_config( hass, msg['config_id'] )
-        config.setEnabled( msg['enabled'] )
-        await config.start()
-
-        await store.set_managed_switch( config )
+        config = managed_switches.get(msg['config_id'])
+        # Re-emitted toggles would otherwise tear down and re-subscribe the listeners
+        if config.setEnabled( msg['enabled'] ):
+            await config.start()
+            await store.set_managed_switch( config )
 
         connection.send_result(msg['id'], {
             "switch_id": config.id,
@@ -168,8 +187,6 @@ async def async_setup_connections( hass ):
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        store = hass.data[DOMAIN][CONF_STORE]
-
         await _remove_switch_config( hass, msg['config_id'] )    
         await store.delete_managed_switch( msg['config_id'] )
 
@@ -7,6 +7,7 @@ CONF_BLUEPRINTS = "blueprints"
 CONF_SWITCH_CONFIGS = 'switch_configs'
 CONF_MANAGED_SWITCHES = "managed_switches"
 CONF_STORE = 'store'
+CONF_BLUEPRINT_CACHE = 'blueprint_cache'
 
 PANEL_URL = "/switch_manager_panel.js"
 
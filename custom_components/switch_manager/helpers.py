@@ -1,6 +1,9 @@
 """Helpers for switch_manager integration."""
-import json, pathlib, os, shutil
+from __future__ import annotations
+
+import asyncio, json, pathlib, os, shutil
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
 from homeassistant.util.yaml.loader import _find_files, load_yaml
 from .const import (
     LOGGER, 
@@ -10,22 +13,28 @@ from .const import (
     CONF_MANAGED_SWITCHES
 )
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.components.mqtt.models import ReceiveMessage
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import ReceiveMessage
 
 COMPONENT_PATH = os.path.dirname(os.path.realpath(__file__))
 
-MANIFEST = json.load(
-        open( os.path.join( COMPONENT_PATH, 'manifest.json') )
-    )
-    
+# Parsed once at import; the manifest is immutable for the life of the process
+with open( os.path.join( COMPONENT_PATH, 'manifest.json') ) as manifest_file:
+    MANIFEST = json.load( manifest_file )
+
 VERSION = MANIFEST['version']
 
 
 async def check_blueprints_folder_exists( hass ):
     dest_folder = pathlib.Path(hass.config.path(BLUEPRINTS_FOLDER, DOMAIN))
-    return os.path.exists( dest_folder )
+    return await hass.async_add_executor_job( os.path.exists, dest_folder )
 
 async def deploy_blueprints( hass ):
+    await hass.async_add_executor_job( _deploy_blueprints, hass )
+
+def _deploy_blueprints( hass ):
     dest_folder = pathlib.Path(hass.config.path(BLUEPRINTS_FOLDER, DOMAIN))
     if not os.path.exists( dest_folder ):
         os.makedirs( dest_folder )
@@ -39,27 +48,43 @@ async def deploy_blueprints( hass ):
                 dest_folder
             )
 
-def load_blueprints( hass ):
+async def find_blueprints( hass ) -> dict:
+    """Map each blueprint file to [mtime, has_image], used to key the blueprint cache."""
     folder = pathlib.Path(hass.config.path(BLUEPRINTS_FOLDER, DOMAIN))
-    results = [];
+    return await hass.async_add_executor_job( _find_blueprint_files, folder )
+
+async def load_blueprints( hass, files: dict ):
+    # Read and parse the files concurrently in the executor; has_image comes from
+    # find_blueprints so the loaded configs match the cache key
+    results = await asyncio.gather(
+            *( hass.async_add_executor_job( _load_blueprint, f, has_image ) for f, (_, has_image) in files.items() )
+        )
+    return [result for result in results if result is not None]
+
+def _find_blueprint_files( folder ) -> dict:
+    files = {}
     for f in _find_files(folder, "*.yaml"):
-        try:
-            data = load_yaml(f)
-        except HomeAssistantError as ex:
-            LOGGER.error(str(ex))
-            continue
-        results.append({
-            'id': os.path.splitext(os.path.basename(f))[0],
-            'has_image': os.path.exists(
-                os.path.join(folder, os.path.splitext(os.path.basename(f))[0] + '.png')
-            ),
-            'data': data        
-        })
-    return results
+        files[str(f)] = [
+            os.path.getmtime(f),
+            os.path.exists( os.path.join(folder, os.path.splitext(os.path.basename(f))[0] + '.png') )
+        ]
+    return files
+
+def _load_blueprint( f, has_image: bool ):
+    try:
+        data = load_yaml(f)
+    except HomeAssistantError as ex:
+        LOGGER.error(str(ex))
+        return None
+    return {
+        'id': os.path.splitext(os.path.basename(f))[0],
+        'has_image': has_image,
+        'data': data        
+    }
 
 def format_mqtt_message( message: ReceiveMessage):
     try:
-        data = json.loads(message.payload)
+        data = json_loads(message.payload)
     except ValueError as e:
         data = {
             "payload": message.payload
@@ -103,5 +128,7 @@ def _get_switch_config( hass: HomeAssistant, _id: str ):
     return hass.data[DOMAIN][CONF_MANAGED_SWITCHES].get(_id)
 
 async def _remove_switch_config( hass: HomeAssistant, _id: str ):
-    hass.data[DOMAIN][CONF_MANAGED_SWITCHES][_id].stop()
-    del hass.data[DOMAIN][CONF_MANAGED_SWITCHES][_id]
\ No newline at end of file
+    # Single lookup; a repeated delete for the same id is a no-op
+    config = hass.data[DOMAIN][CONF_MANAGED_SWITCHES].pop(_id, None)
+    if config is not None:
+        config.stop()
\ No newline at end of file
@@ -1,15 +1,20 @@
+from __future__ import annotations
+
 import time
+from typing import TYPE_CHECKING
 from .const import DOMAIN, LOGGER
 from .helpers import format_mqtt_message, get_val_from_str
 from homeassistant.core import HomeAssistant, Context, callback
 from homeassistant.helpers.script import Script
 from homeassistant.helpers.condition import async_template as template_condition
 from homeassistant.helpers.template import Template
-from homeassistant.components.mqtt.client import async_subscribe as mqtt_subscribe
-from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.helpers.json import json_dumps
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import ReceiveMessage
+
 def check_conditions( hass: HomeAssistant, conditions, data ) -> bool:
     if not conditions:
         return True
@@ -25,7 +30,8 @@ def check_conditions( hass: HomeAssistant, conditions, data ) -> bool:
 def convert_conditions( hass: HomeAssistant, conditions ):
     if isinstance(conditions, str):
         return Template(conditions, hass)
-    return conditions
+    # Conditions are read only once loaded
+    return tuple(conditions) if conditions else ()
 
 async def create_event_listeners( hass: HomeAssistant, blueprint, mqtt_topic, _callback ):
     @callback
@@ -40,17 +46,24 @@ async def create_event_listeners( hass: HomeAssistant, blueprint, mqtt_topic, _c
     listeners = []
     if blueprint.is_mqtt:
         try:
+            # Only pull in the mqtt component when a blueprint actually uses it
+            from homeassistant.components.mqtt.client import async_subscribe as mqtt_subscribe
             listeners.append( await mqtt_subscribe(hass, mqtt_topic, _handleMQTT) )
             if blueprint.mqtt_sub_topics:
                 listeners.append( await mqtt_subscribe(hass, f"{mqtt_topic}/#", _handleMQTT) )
-        except HomeAssistantError:
+        except (ImportError, HomeAssistantError):
             LOGGER.error(f"Unable to handle switch as MQTT is not loaded")
     else:
         listeners.append( hass.bus.async_listen(blueprint.event_type, _handleEvent) )
     return listeners
 
 class Blueprint:
-    
+
+    __slots__ = (
+        '_hass', 'id', 'name', 'has_image', 'service', 'event_type', 'is_mqtt', 'mqtt_topic_format',
+        'mqtt_sub_topics', 'identifier_key', 'info', 'conditions', 'buttons', '_json'
+    )
+
     def __init__(self, hass, _id: str, config: dict, has_image: bool):
         """Initialize Blueprint."""
         self._hass = hass
@@ -66,9 +79,11 @@ class Blueprint:
         self.info = config.get('info')
         self.conditions = convert_conditions( hass, config.get('conditions', []) )
 
-        self.buttons = [] # config.get('buttons')
-        for i in range(len(config.get('buttons'))):
-            self.buttons.append( BlueprintButton( hass, config.get('buttons')[i], i ) )
+        self.buttons = tuple(
+                BlueprintButton( hass, button, i ) for i, button in enumerate(config.get('buttons'))
+            )
+
+        self._json = None
 
     def check_conditions( self, data ):
         if self.identifier_key and self.identifier_key not in data:
@@ -102,12 +117,18 @@ class Blueprint:
         listeners = await create_event_listeners( self._hass, self, self.mqtt_topic_format, _processIncoming )
         return remove_listener
 
+    # Blueprints are immutable once loaded (reload builds new instances) so the
+    # serialized form is cached for the websocket responses
+    def as_json(self) -> str:
+        if self._json is None:
+            self._json = json_dumps(self)
+        return self._json
+
     def from_dict(cls, data):
         return cls(**data)
 
     def as_dict(self):
-        res = self.__dict__.copy()
-        res.pop('_hass')
+        res = {k: getattr(self, k) for k in self.__slots__ if k not in ('_hass', '_json')}
         if isinstance(self.conditions, Template):
             res['conditions'] = self.conditions.template
         return res
@@ -117,6 +138,8 @@ class Blueprint:
 
 class BlueprintButton:
 
+    __slots__ = ('_hass', 'x', 'y', 'd', 'width', 'height', 'conditions', 'index', 'actions')
+
     def __init__(self, hass, config: dict, index):
         """Initialize BlueprintButton."""
         self._hass = hass
@@ -128,9 +151,9 @@ class BlueprintButton:
         self.conditions = convert_conditions( hass, config.get('conditions', []) )
         self.index = index;
 
-        self.actions = []
-        for i in range(len(config.get('actions'))):
-            self.actions.append( BlueprintButtonAction( hass, config.get('actions')[i], i ) )        
+        self.actions = tuple(
+                BlueprintButtonAction( hass, action, i ) for i, action in enumerate(config.get('actions'))
+            )
 
     def check_conditions( self, data ):
         return check_conditions( self._hass, self.conditions, data )
@@ -139,9 +162,7 @@ class BlueprintButton:
         return cls(**data)
 
     def as_dict(self):
-        res = self.__dict__.copy()
-        res.pop('_hass')
-        res.pop('index')
+        res = {k: getattr(self, k) for k in self.__slots__ if k not in ('_hass', 'index')}
         if isinstance(self.conditions, Template):
             res['conditions'] = self.conditions.template
         return res
@@ -151,6 +172,8 @@ class BlueprintButton:
 
 class BlueprintButtonAction:
 
+    __slots__ = ('_hass', 'title', 'conditions', 'index')
+
     def __init__(self, hass, config: dict, index):
         self._hass = hass
         self.title = config.get('title')
@@ -164,9 +187,7 @@ class BlueprintButtonAction:
         return cls(**data)
 
     def as_dict(self):
-        res = self.__dict__.copy()
-        res.pop('_hass')
-        res.pop('index')
+        res = {k: getattr(self, k) for k in self.__slots__ if k not in ('_hass', 'index')}
         if isinstance(self.conditions, Template):
             res['conditions'] = self.conditions.template
         return res
@@ -176,6 +197,8 @@ class BlueprintButtonAction:
 
 class ManagedSwitchConfigButtonAction:
 
+    __slots__ = ('_hass', 'switch_id', 'button_index', 'index', 'sequence', 'mode', 'blueprint', 'script', 'active')
+
     def __init__( self, hass: HomeAssistant, switch_id, button_index, index, blueprint_action, config ):
         """Initialize ManagedSwitchConfigButtonAction."""
         self._hass: HomeAssistant = hass
@@ -212,7 +235,7 @@ class ManagedSwitchConfigButtonAction:
 
     # home assistant json
     def as_dict(self):
-        return {k: v for k, v in self.__dict__.items() if k in ['sequence', 'mode']}
+        return {'sequence': self.sequence, 'mode': self.mode}
 
     # attr dict
     def asdict(self):
@@ -220,6 +243,8 @@ class ManagedSwitchConfigButtonAction:
 
 class ManagedSwitchConfigButton:
 
+    __slots__ = ('_hass', 'switch_id', 'index', 'actions', 'blueprint', 'active')
+
     def __init__( self, hass: HomeAssistant, switch_id, index, blueprint_button, config ):
         """Initialize ManagedSwitchConfigButton."""
         self._hass: HomeAssistant = hass
@@ -260,7 +285,7 @@ class ManagedSwitchConfigButton:
 
     # home assistant json
     def as_dict(self):
-        return {k: v for k, v in self.__dict__.items() if k in ['actions']}
+        return {'actions': self.actions}
 
     # attr dict
     def asdict(self):
@@ -268,6 +293,11 @@ class ManagedSwitchConfigButton:
 
 class ManagedSwitchConfig:
 
+    __slots__ = (
+        '_hass', '_event_listeners', '_error', 'id', 'name', 'identifier', 'blueprint', 'valid_blueprint',
+        'is_mismatch', 'variables', 'buttons', 'enabled', 'button_last_state', 'listeners'
+    )
+
     # Allow the switch to be created so it can be deleted or fixed via GUI
     def __init__( self, hass: HomeAssistant, blueprint: Blueprint, _id, config ):
         """Initialize ManagedSwitch."""
@@ -404,8 +434,12 @@ class ManagedSwitchConfig:
                 if action.script:
                     self._hass.async_create_task( action.script.async_stop() )
                     
-    def setEnabled( self, value: bool ):
+    def setEnabled( self, value: bool ) -> bool:
+        """Set enabled state, returning whether it changed."""
+        if self.enabled == value:
+            return False
         self.enabled = value
+        return True
 
     def _check_conditons( self, data ) -> bool:
         if not self.blueprint.is_mqtt:
@@ -422,11 +456,7 @@ class ManagedSwitchConfig:
 
     # home assistant json
     def as_dict(self):
-        res = self.__dict__.copy()
-        res.pop('_hass')
-        res.pop('_event_listeners')
-        res.pop('listeners')
-        return res
+        return {k: getattr(self, k) for k in self.__slots__ if k not in ('_hass', '_event_listeners', 'listeners')}
 
     # attr dict
     def asdict(self):
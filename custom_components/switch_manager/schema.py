@@ -6,9 +6,11 @@ CONDITION_SCHEMA = vol.Schema({
     vol.Required('key'): cv.string,
     vol.Required('value'): cv.string,
 })
+# A list of key/value conditions or a template string, shared by blueprints, buttons and actions
+CONDITIONS_SCHEMA = vol.Any([CONDITION_SCHEMA], cv.string)
 BLUEPRINT_ACTION_SCHEMA = vol.Schema({
     vol.Required('title'): cv.string,
-    vol.Optional('conditions', default=[]): vol.Any(cv.string, [CONDITION_SCHEMA])
+    vol.Optional('conditions', default=[]): CONDITIONS_SCHEMA
 })
 SHAPE_CIRCLE_SCHEMA = vol.Schema({
     vol.Required('x'): cv.positive_int,
@@ -24,7 +26,7 @@ SHAPE_PATH_SCHEMA = vol.Schema({
 
 BLUEPRINT_BUTTON_SCHEMA = vol.Schema({
     vol.Required('actions'): vol.All(cv.ensure_list, [BLUEPRINT_ACTION_SCHEMA]),
-    vol.Optional('conditions', default=[]): vol.Any(cv.string, [CONDITION_SCHEMA]),
+    vol.Optional('conditions', default=[]): CONDITIONS_SCHEMA,
 
     vol.Optional('x'): cv.positive_int,
     vol.Optional('y'): cv.positive_int,
@@ -37,7 +39,7 @@ BLUEPRINT_SCHEMA = vol.Schema({
     vol.Required('service'): cv.string,
     vol.Required('event_type'): cv.string,
     vol.Required('buttons'): vol.All(cv.ensure_list, [BLUEPRINT_BUTTON_SCHEMA]),
-    vol.Optional('conditions', default=[]): vol.Any(cv.string, [CONDITION_SCHEMA]),
+    vol.Optional('conditions', default=[]): CONDITIONS_SCHEMA,
     vol.Optional('info'): cv.string
 })
 BLUEPRINT_EVENT_SCHEMA = BLUEPRINT_SCHEMA.extend({
@@ -62,9 +64,16 @@ SWITCH_MANAGER_CONFIG_SCHEMA = vol.Schema({
     vol.Required('identifier'): cv.string,
     vol.Optional('variables'): vol.Any(None, dict),
     vol.Required('buttons'): vol.All(cv.ensure_list, [SWITCH_MANAGER_CONFIG_BUTTON_SCHEMA])
-}, extra=vol.ALLOW_EXTRA)
+}, extra=vol.REMOVE_EXTRA) # The panel sends back the full config object; only keep the declared fields
 
 SERVICE_SET_VARIABLES_SCHEMA = vol.Schema({
     vol.Required('switch_id'): vol.Any(str, int),
     vol.Required('variables'): dict,
-})
\ No newline at end of file
+})
+
+
+def validate_blueprint( data ) -> dict:
+    """Validate blueprint data with the prebuilt schema for its event type."""
+    if isinstance(data, dict) and data.get('event_type') == 'mqtt':
+        return BLUEPRINT_MQTT_SCHEMA(data)
+    return BLUEPRINT_EVENT_SCHEMA(data)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import copy
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import callback
 from .const import LOGGER
 from .models import ManagedSwitchConfig
 import attr
 
 STORAGE_VERSION = 1
 STORAGE_ID = "switch_manager"
+# Seconds to wait before flushing, so bursts of edits/toggles collapse into one write
+SAVE_DELAY = 1
+BLUEPRINT_CACHE_VERSION = 1
+BLUEPRINT_CACHE_ID = f"{STORAGE_ID}.blueprints"
 
 
 @attr.s
@@ -18,8 +25,16 @@ class SwitchManagerManagedSwitchData:
     buttons = attr.ib(type=list, default=[])
 
     def set_from_managed_switch_config( self, config: ManagedSwitchConfig ):
-        self.__dict__.update(config.as_dict())      
+        # Keep plain JSON ready copies, not the live model objects, as the store
+        # deep copies and serializes this data when the delayed write runs
+        self.name = config.name
+        self.enabled = config.enabled
         self.blueprint = config.blueprint.id
+        self.identifier = config.identifier
+        self.variables = copy.deepcopy(config.variables)
+        self.buttons = copy.deepcopy([
+                {'actions': [action.as_dict() for action in button.actions]} for button in config.buttons
+            ])
 
     @classmethod
     def from_dict(cls, data):
@@ -49,9 +64,19 @@ class SwitchManagerStore:
         self.dirty = False
 
     async def save(self):
-        await self.store.async_save(attr.asdict(self.data))
+        # Writes immediately and cancels any pending delayed write
+        await self.store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict:
+        # Called for both immediate and delayed writes, so the data is on disk after this
+        self.dirty = False
+        return attr.asdict(self.data)
 
     async def load(self):
+        # Write out a pending delayed save first so reloading reads it back from disk
+        if self.dirty:
+            await self.save()
         stored = await self.store.async_load()
         if stored:
             self.data = SwitchManagerStoreData.from_dict(stored)
@@ -64,7 +89,8 @@ class SwitchManagerStore:
 
     async def updated(self):
         self.dirty = True
-        await self.save()
+        # Debounced write; pending data is flushed by the store on shutdown
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     async def get_managed_switches(self):
         return self.data.managed_switches
@@ -77,8 +103,8 @@ class SwitchManagerStore:
         await self.updated()
 
     async def delete_managed_switch(self, _id: str):
-        del self.data.managed_switches[_id]
-        await self.updated()
+        if self.data.managed_switches.pop(_id, None) is not None:
+            await self.updated()
 
     def asdict(self):
         return self.data.asdict()
@@ -94,4 +120,29 @@ class SwitchManagerStore:
 
         self.data.managed_switches[config_data.id] = config
         await self.updated()
-        
\ No newline at end of file
+
+class SwitchManagerBlueprintCache:
+    """Validated blueprint data, reused while the versions and blueprint files are unchanged."""
+
+    def __init__(self, hass):
+        self.store = hass.helpers.storage.Store(BLUEPRINT_CACHE_VERSION, BLUEPRINT_CACHE_ID)
+
+    async def load(self, version, files: dict) -> list | None:
+        cached = await self.store.async_load()
+        # The data went through HA's config validators, so an HA upgrade invalidates it too
+        if (
+            not cached
+            or cached.get('version') != str(version)
+            or cached.get('ha_version') != HA_VERSION
+            or cached.get('files') != files
+        ):
+            return None
+        return cached.get('blueprints')
+
+    async def save(self, version, files: dict, blueprints: list):
+        await self.store.async_save({
+            'version': str(version),
+            'ha_version': HA_VERSION,
+            'files': files,
+            'blueprints': blueprints
+        })